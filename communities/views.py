@@ -58,7 +58,7 @@ class CommunityDetailView(PaginatedViewMixin, DetailView):
         """Return posts for the current community ordered by newest first."""
         queryset = (
             Post.objects.filter(community=self.object)
-            .select_related("community", "user")
+            .select_related("community", "user__profile")
             .order_by("-created_at")
         )
 
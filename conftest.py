@@ -0,0 +1,11 @@
+from collections.abc import Iterator
+
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> Iterator[None]:
+    """Clear the process-wide cache so entries never leak between tests."""
+    yield
+    cache.clear()
@@ -65,7 +65,7 @@ class FeedView(PaginatedViewMixin, TemplateView):
         if self.request.user.is_authenticated:
             queryset = (
                 Post.objects.filter(community__subscriptions__user=self.request.user)
-                .select_related("user", "community")
+                .select_related("user__profile", "community")
                 .order_by("-created_at")
             )
 
@@ -80,7 +80,9 @@ class FeedView(PaginatedViewMixin, TemplateView):
 
             return queryset
 
-        return Post.objects.order_by("-created_at")[:50]
+        return Post.objects.select_related("user__profile", "community").order_by(
+            "-created_at"
+        )[:50]
 
 
 class PostVoteView(LoginRequiredMixin, View):
@@ -13,6 +13,7 @@ uv Integration:
 pytest Integration:
 - `invoke test.run` - Run tests with pytest
 - `invoke test.coverage` - Coverage with pytest-cov
+- `invoke test.run --parallel` - Run test files across CPU cores with pytest-xdist
 
 ruff Integration:
 - `invoke lint.check` - Check code with ruff
@@ -25,12 +26,26 @@ Additional Features:
 - `invoke dev` - Quick development setup
 """
 
-from pathlib import Path
+from functools import lru_cache
 
 from invoke import Collection, task
 from invoke.exceptions import Exit
 
 
+@lru_cache(maxsize=4)
+def _env_for(settings):
+    """
+    Build the extra environment for Django commands.
+
+    Invoke merges it into ``os.environ`` for the child process, so only the
+    settings override is needed.
+
+    Args:
+        settings: Django settings module
+    """
+    return {"DJANGO_SETTINGS_MODULE": settings} if settings else {}
+
+
 @task
 def runserver(c, host="127.0.0.1", port=8000, settings=None):
     """
@@ -44,10 +59,7 @@ def runserver(c, host="127.0.0.1", port=8000, settings=None):
     print(f"🌐 Starting Django server on {host}:{port}")
 
     cmd = f"uv run python manage.py runserver {host}:{port}"
-    if settings:
-        cmd = f"DJANGO_SETTINGS_MODULE={settings} {cmd}"
-
-    c.run(cmd, pty=True)
+    c.run(cmd, env=_env_for(settings), pty=True)
 
 
 @task
@@ -61,10 +73,7 @@ def shell(c, settings=None):
     print("🐍 Starting Django shell...")
 
     cmd = "uv run python manage.py shell"
-    if settings:
-        cmd = f"DJANGO_SETTINGS_MODULE={settings} {cmd}"
-
-    c.run(cmd, pty=True)
+    c.run(cmd, env=_env_for(settings), pty=True)
 
 
 @task
@@ -85,10 +94,7 @@ def migrate(c, app=None, fake=False, settings=None):
     if fake:
         cmd += " --fake"
 
-    if settings:
-        cmd = f"DJANGO_SETTINGS_MODULE={settings} {cmd}"
-
-    c.run(cmd)
+    c.run(cmd, env=_env_for(settings))
     print("✅ Migrations completed!")
 
 
@@ -113,10 +119,7 @@ def makemigrations(c, app=None, name=None, empty=False, settings=None):
     if empty:
         cmd += " --empty"
 
-    if settings:
-        cmd = f"DJANGO_SETTINGS_MODULE={settings} {cmd}"
-
-    c.run(cmd)
+    c.run(cmd, env=_env_for(settings))
     print("✅ Migrations created!")
 
 
@@ -125,8 +128,9 @@ def test(
     c,
     app=None,
     pattern=None,
-    keepdb=False,
+    create_db=False,
     verbose=False,
+    parallel=False,
     settings=None,
 ):
     """
@@ -135,8 +139,9 @@ def test(
     Args:
         app: Specific app to test
         pattern: Test pattern to match
-        keepdb: Keep test database
+        create_db: Rebuild the test database instead of reusing it
         verbose: Verbose output
+        parallel: Distribute tests across CPU cores with pytest-xdist
         settings: Django settings module
     """
     print("🧪 Running tests with pytest...")
@@ -145,17 +150,16 @@ def test(
 
     if verbose:
         cmd += " -v"
-    if keepdb:
-        cmd += " --reuse-db"
+    if parallel:
+        cmd += " -n auto --dist=loadfile"
+    if create_db:
+        cmd += " --create-db"
     if pattern:
         cmd += f" -k {pattern}"
     if app:
         cmd += f" {app}/"
 
-    if settings:
-        cmd = f"DJANGO_SETTINGS_MODULE={settings} {cmd}"
-
-    result = c.run(cmd, warn=True)
+    result = c.run(cmd, env=_env_for(settings), warn=True)
     if result.exited != 0:
         print("❌ Tests failed!")
         raise Exit(code=1)
@@ -164,18 +168,21 @@ def test(
 
 
 @task
-def coverage(c, app=None, html=False, settings=None):
+def coverage(c, app=None, html=False, parallel=False, settings=None):
     """
     Run tests with coverage report using pytest-cov.
 
     Args:
         app: Specific app to test
         html: Generate HTML coverage report
+        parallel: Distribute tests across CPU cores with pytest-xdist
         settings: Django settings module
     """
     print("📊 Running tests with coverage...")
 
     cmd = "uv run pytest --cov=."
+    if parallel:
+        cmd += " -n auto --dist=loadfile"
     if app:
         cmd += f" {app}/"
     if html:
@@ -184,10 +191,7 @@ def coverage(c, app=None, html=False, settings=None):
     # Always show terminal report
     cmd += " --cov-report=term-missing"
 
-    if settings:
-        cmd = f"DJANGO_SETTINGS_MODULE={settings} {cmd}"
-
-    c.run(cmd)
+    c.run(cmd, env=_env_for(settings))
 
     if html:
         print("📄 HTML coverage report generated in htmlcov/")
@@ -213,7 +217,7 @@ def lint(c, fix=False, check=False):
         print("✅ Code formatted and linted with ruff!")
     elif check:
         print("Running ruff (check only)...")
-        result1 = c.run("uv run ruff check .", warn=True)
+        result1 = c.run("uv run ruff check --no-fix .", warn=True)
         result2 = c.run("uv run ruff format --check .", warn=True)
 
         if result1.exited != 0 or result2.exited != 0:
@@ -222,7 +226,7 @@ def lint(c, fix=False, check=False):
         print("✅ No linting issues found!")
     else:
         # Default behavior: check and show issues
-        c.run("uv run ruff check .")
+        c.run("uv run ruff check --no-fix .")
         result = c.run("uv run ruff format --check .", warn=True)
         if result.exited != 0:
             print("💡 Run 'invoke lint --fix' to automatically fix formatting issues.")
@@ -253,10 +257,7 @@ def collectstatic(c, noinput=True, settings=None):
     if noinput:
         cmd += " --noinput"
 
-    if settings:
-        cmd = f"DJANGO_SETTINGS_MODULE={settings} {cmd}"
-
-    c.run(cmd)
+    c.run(cmd, env=_env_for(settings))
     print("✅ Static files collected!")
 
 
@@ -278,10 +279,7 @@ def createsuperuser(c, username=None, email=None, settings=None):
     if email:
         cmd += f" --email {email}"
 
-    if settings:
-        cmd = f"DJANGO_SETTINGS_MODULE={settings} {cmd}"
-
-    c.run(cmd, pty=True)
+    c.run(cmd, env=_env_for(settings), pty=True)
     print("✅ Superuser created!")
 
 
@@ -297,10 +295,7 @@ def loaddata(c, fixture, settings=None):
     print(f"📥 Loading fixture: {fixture}")
 
     cmd = f"uv run python manage.py loaddata {fixture}"
-    if settings:
-        cmd = f"DJANGO_SETTINGS_MODULE={settings} {cmd}"
-
-    c.run(cmd)
+    c.run(cmd, env=_env_for(settings))
     print("✅ Fixture loaded!")
 
 
@@ -309,26 +304,30 @@ def dumpdata(c, app=None, output=None, indent=2, settings=None):
     """
     Dump data to fixture using uv.
 
+    The dump is always written to a file: Invoke buffers everything a command
+    prints to stdout, which would hold the whole fixture in memory.
+
     Args:
         app: Specific app to dump data from
-        output: Output file name
+        output: Output file name (default: dump_<timestamp>.json)
         indent: JSON indentation
         settings: Django settings module
     """
-    print("📤 Dumping data...")
+    if not output:
+        from datetime import datetime
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = f"dump_{timestamp}.json"
+
+    print(f"📤 Dumping data to {output}...")
 
-    cmd = "uv run python manage.py dumpdata"
+    cmd = f"uv run python manage.py dumpdata --output {output}"
     if app:
         cmd += f" {app}"
-    if output:
-        cmd += f" --output {output}"
     if indent:
         cmd += f" --indent {indent}"
 
-    if settings:
-        cmd = f"DJANGO_SETTINGS_MODULE={settings} {cmd}"
-
-    c.run(cmd)
+    c.run(cmd, env=_env_for(settings))
     print("✅ Data dumped!")
 
 
@@ -351,9 +350,30 @@ def reset_db(c, settings=None):
 
     print("🗑️  Resetting database...")
 
-    # Remove migration files (except __init__.py)
-    for app_dir in Path().glob("*/migrations"):
-        for migration_file in app_dir.glob("*.py"):
+    import os
+    from pathlib import Path
+
+    import django
+    from django.apps import apps
+
+    if settings:
+        os.environ["DJANGO_SETTINGS_MODULE"] = settings
+    else:
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+    django.setup()
+
+    # Remove migration files (except __init__.py) of the project's own apps
+    base_dir = Path(__file__).resolve().parent
+    for app_config in apps.get_app_configs():
+        app_path = Path(app_config.path)
+        if not app_path.is_relative_to(base_dir) or "site-packages" in app_path.parts:
+            continue
+
+        migrations_dir = app_path / "migrations"
+        if not migrations_dir.is_dir():
+            continue
+
+        for migration_file in migrations_dir.glob("*.py"):
             if migration_file.name != "__init__.py":
                 migration_file.unlink()
                 print(f"Removed {migration_file}")
@@ -366,12 +386,13 @@ def reset_db(c, settings=None):
 
 
 @task
-def backup_db(c, output=None, settings=None):
+def backup_db(c, output=None, indent=None, settings=None):
     """
     Create database backup using uv.
 
     Args:
         output: Output file name
+        indent: JSON indentation (default: compact output)
         settings: Django settings module
     """
     if not output:
@@ -381,7 +402,7 @@ def backup_db(c, output=None, settings=None):
         output = f"backup_{timestamp}.json"
 
     print(f"💾 Creating database backup: {output}")
-    dumpdata(c, output=output, settings=settings)
+    dumpdata(c, output=output, indent=indent, settings=settings)
     print("✅ Database backup created!")
 
 
@@ -438,19 +459,23 @@ def clean(c):
     """Clean up temporary files and caches."""
     print("🧹 Cleaning up temporary files...")
 
-    # Remove Python cache files
-    c.run("find . -type f -name '*.pyc' -delete", warn=True)
-    c.run("find . -type d -name '__pycache__' -delete", warn=True)
-
-    # Remove pytest cache
-    c.run("rm -rf .pytest_cache/", warn=True)
+    import os
+    import shutil
+    from pathlib import Path
 
-    # Remove coverage files
-    c.run("rm -rf htmlcov/", warn=True)
-    c.run("rm -f .coverage", warn=True)
+    # Remove Python cache files in a single bottom-up traversal
+    for root, _dirs, files in os.walk(".", topdown=False):
+        root_path = Path(root)
+        for name in files:
+            if name.endswith(".pyc"):
+                (root_path / name).unlink(missing_ok=True)
+        if root_path.name == "__pycache__":
+            shutil.rmtree(root_path, ignore_errors=True)
 
-    # Remove ruff cache
-    c.run("rm -rf .ruff_cache/", warn=True)
+    # Remove pytest, coverage and ruff caches
+    for cache_dir in (".pytest_cache", "htmlcov", ".ruff_cache"):
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    Path(".coverage").unlink(missing_ok=True)
 
     print("✅ Cleanup completed!")
 
@@ -466,10 +491,7 @@ def check(c, settings=None):
     print("🔍 Running Django system checks...")
 
     cmd = "uv run python manage.py check"
-    if settings:
-        cmd = f"DJANGO_SETTINGS_MODULE={settings} {cmd}"
-
-    result = c.run(cmd, warn=True)
+    result = c.run(cmd, env=_env_for(settings), warn=True)
     if result.exited != 0:
         print("❌ System checks failed!")
         raise Exit(code=1)
@@ -482,11 +504,17 @@ def ci(c):
     """Run full CI pipeline (lint, type check, test, security)."""
     print("🚀 Running full CI pipeline...")
 
-    lint(c, check=True)
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    # Lint and system checks are read-only, so they run alongside the test suite.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(lint, c, check=True), pool.submit(check, c)]
 
-    coverage(c)
+        coverage(c)
 
-    check(c)
+        # Re-raise any failure (e.g. ``Exit``) from the background tasks.
+        for future in as_completed(futures):
+            future.result()
 
     print("✅ CI pipeline completed successfully!")
 
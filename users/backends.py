@@ -2,10 +2,10 @@ from typing import Any
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
-from django.db.models import Q
 from django.http import HttpRequest
 
 from users.models import User
+from users.selectors import SESSION_USER_FIELDS, get_login_user
 
 UserModel = get_user_model()
 
@@ -20,15 +20,41 @@ class EmailOrUsernameModelBackend(ModelBackend):
         password: str | None = None,
         **kwargs: Any,
     ) -> User | None:
-        """Authenticate a user."""
-        try:
-            user = UserModel.objects.get(
-                Q(username__iexact=username) | Q(email__iexact=username)
-            )
-        except UserModel.DoesNotExist:
+        """
+        Authenticate a user.
+
+        Missing credentials are rejected without querying the database.
+        Otherwise the user is fetched by username or email in a single query
+        and the password is checked against it.
+        """
+        if not username or not password:
+            UserModel().set_password(password or "")
+            return None
+
+        user = get_login_user(username)
+
+        if user is None:
+            # Run the default password hasher once to reduce the timing
+            # difference between an existing and a nonexistent user.
+            UserModel().set_password(password)
             return None
 
+        # check_password also upgrades a hash made with an outdated hasher.
         if not user.check_password(password):
             return None
 
         return user
+
+    def get_user(self, user_id: Any) -> User | None:
+        """
+        Load the user attached to the current session.
+
+        Only SESSION_USER_FIELDS are fetched; any other field is loaded on
+        first access.
+        """
+        try:
+            user = UserModel._default_manager.only(*SESSION_USER_FIELDS).get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+
+        return user if self.user_can_authenticate(user) else None
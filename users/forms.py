@@ -1,7 +1,7 @@
 from django import forms
 from django.forms.widgets import PasswordInput
 
-from users.validators import UserUsernameValidator, validate_user_password
+from users.validators import validate_user_password, validate_user_username
 
 
 class UserRegisterForm(forms.Form):
@@ -15,6 +15,8 @@ class UserRegisterForm(forms.Form):
         password2 (CharField): Confirmation of the chosen password (8-128 characters).
 
     Validation:
+        - Only `password1` runs the password strength validator; `password2`
+          must match it, so validating both would repeat the same work.
         - Ensures that `password1` and `password2` match.
         - Raises a ValidationError with code 'password_mismatch' if they differ.
     """
@@ -23,7 +25,7 @@ class UserRegisterForm(forms.Form):
         label="Username",
         max_length=30,
         min_length=3,
-        validators=(UserUsernameValidator(),),
+        validators=(validate_user_username,),
     )
     email = forms.EmailField(label="Email", max_length=250)
     password1 = forms.CharField(
@@ -38,7 +40,6 @@ class UserRegisterForm(forms.Form):
         widget=forms.PasswordInput,
         min_length=8,
         max_length=128,
-        validators=(validate_user_password,),
     )
 
     def clean(self) -> dict:
@@ -76,6 +77,6 @@ class UserLoginForm(forms.Form):
     """
 
     username = forms.CharField(label="Email/Username", max_length=128)
-    password = forms.CharField(
-        label="Password", widget=PasswordInput, min_length=8, max_length=128
-    )
+    # Only an upper bound: the password policy is enforced at registration,
+    # and the cap keeps oversized inputs away from the password hasher.
+    password = forms.CharField(label="Password", widget=PasswordInput, max_length=128)
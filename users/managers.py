@@ -1,6 +1,9 @@
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
 from django.contrib.auth.models import BaseUserManager
+from django.db import transaction
+from django.db.models import QuerySet
 
 if TYPE_CHECKING:
     from .models import User
@@ -29,10 +32,10 @@ class UserManager(BaseUserManager):
             User: Newly created user instance
 
         Raises:
-            ValueError: If email or username is not provided
+            ValidationError: If a field fails validation
+            IntegrityError: If the email or username is already taken
         """
         email = self.normalize_email(email)
-        username = username.strip()
 
         user = self.model(
             email=email,
@@ -40,7 +43,10 @@ class UserManager(BaseUserManager):
             password=password,
             **extra_fields,
         )
-        user.full_clean()
+        # Uniqueness is left to the database constraints, which saves the
+        # SELECT per unique field that validate_unique() would issue.
+        user.clean_fields()
+        user.clean()
         user.set_password(password)
         user.save(using=self._db)
         return user
@@ -77,3 +83,47 @@ class UserManager(BaseUserManager):
             raise ValueError("Superuser must have is_superuser=True")
 
         return self.create_user(email, username, password, **extra_fields)
+
+    def bulk_create_with_profiles(
+        self, users: Iterable["User"], batch_size: int = 1000
+    ) -> list["User"]:
+        """
+        Insert many users together with their profiles and preferences.
+
+        bulk_create() bypasses User.save, so the related rows it would create
+        are inserted here in bulk as well. Passwords must already
+        be hashed and no model validation is run.
+
+        Args:
+            users: Unsaved User instances
+            batch_size: Maximum number of rows per INSERT statement
+
+        Returns:
+            list[User]: The created users with their primary keys set
+        """
+        from .models import Profile, UserPreferences
+
+        with transaction.atomic(using=self._db):
+            created = self.bulk_create(users, batch_size=batch_size)
+            Profile.objects.using(self._db).bulk_create(
+                [Profile(user_id=user.pk) for user in created],
+                batch_size=batch_size,
+            )
+            UserPreferences.objects.using(self._db).bulk_create(
+                [UserPreferences(user_id=user.pk) for user in created],
+                batch_size=batch_size,
+            )
+
+        return created
+
+    def with_profile(self) -> QuerySet["User"]:
+        """
+        Return users with their profile fetched in the same query.
+
+        Use it wherever a list of users renders profile data (display name,
+        avatar) to avoid one extra query per user.
+
+        Returns:
+            QuerySet[User]: Users with the ``profile`` relation selected
+        """
+        return self.get_queryset().select_related("profile")
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-15 20:55
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_alter_user_email_alter_user_password_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_email_7bbb4c_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_usernam_b79065_idx',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-15 20:58
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_remove_user_user_email_7bbb4c_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='user_email_lower_unique', violation_error_message='A user with that email already exists.'),
+        ),
+    ]
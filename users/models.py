@@ -1,18 +1,30 @@
+import secrets
 from datetime import timedelta
 from typing import Any
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.core.validators import (
     EmailValidator,
     MaxLengthValidator,
 )
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Lower
+from django.templatetags.static import static
 from django.utils import timezone
 
 from .managers import UserManager
 from .utils import user_avatar_path
-from .validators import UserUsernameValidator, validate_user_password
+from .validators import validate_user_password, validate_user_username
+
+ONLINE_THRESHOLD = timedelta(minutes=15)
+LAST_ACTIVE_WRITE_INTERVAL = timedelta(minutes=1)
+SOCIAL_LINK_TEMPLATES = (
+    ("x", "https://x.com/{}"),
+    ("github", "https://github.com/{}"),
+    ("linkedin", "https://linkedin.com/in/{}"),
+)
 
 
 class User(AbstractUser):
@@ -44,7 +56,7 @@ class User(AbstractUser):
         max_length=30,
         unique=True,
         validators=[
-            UserUsernameValidator(),
+            validate_user_username,
         ],
         error_messages={
             "unique": "A user with that username already exists.",
@@ -91,7 +103,7 @@ class User(AbstractUser):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
 
-    def get_display_name(self) -> None:
+    def get_display_name(self) -> str:
         """Return the user's display name (from profile) or username."""
         try:
             if self.profile.display_name:
@@ -101,17 +113,37 @@ class User(AbstractUser):
 
         return self.username
 
+    @property
+    def _last_active_cache_key(self) -> str:
+        return f"user:last_active:{self.pk}"
+
     def update_last_active(self) -> None:
-        """Update the last_active timestamp to now."""
-        self.last_active = timezone.now()
-        self.save(update_fields=["last_active"])
+        """
+        Update the last_active timestamp to now.
+
+        The row is written with a single UPDATE, bypassing save().
+
+        The database write is throttled: the last persisted timestamp is kept
+        in the cache and the row is only updated once it is older than
+        LAST_ACTIVE_WRITE_INTERVAL. The instance is always updated, so
+        is_online() reflects the current request either way.
+        """
+        now = timezone.now()
+        last_saved = cache.get(self._last_active_cache_key)
+        self.last_active = now
+
+        if last_saved is not None and now - last_saved < LAST_ACTIVE_WRITE_INTERVAL:
+            return
+
+        cache.set(self._last_active_cache_key, now, ONLINE_THRESHOLD.total_seconds())
+        User.objects.filter(pk=self.pk).update(last_active=now)
 
     def is_online(self) -> bool:
         """Check if the user is currently online (active in the last 15 minutes)."""
         if not self.last_active:
             return False
 
-        return timezone.now() - self.last_active < timedelta(minutes=15)
+        return timezone.now() - self.last_active < ONLINE_THRESHOLD
 
     def generate_verification_token(self) -> str:
         """
@@ -120,13 +152,12 @@ class User(AbstractUser):
         Returns:
             The generated token
         """
-        import secrets
-
         token = secrets.token_urlsafe(48)
         self.email_verification_token = token
         self.email_verification_sent_at = timezone.now()
-        self.save(
-            update_fields=["email_verification_token", "email_verification_sent_at"]
+        User.objects.filter(pk=self.pk).update(
+            email_verification_token=token,
+            email_verification_sent_at=self.email_verification_sent_at,
         )
 
         return token
@@ -141,7 +172,9 @@ class User(AbstractUser):
         Returns:
             True if verification was successful, False otherwise
         """
-        if not self.email_verification_token or self.email_verification_token != token:
+        if not self.email_verification_token or not secrets.compare_digest(
+            self.email_verification_token, token
+        ):
             return False
 
         if (
@@ -153,25 +186,31 @@ class User(AbstractUser):
         self.email_verified = True
         self.email_verification_token = None
         self.email_verification_sent_at = None
-        self.save(
-            update_fields=[
-                "email_verified",
-                "email_verification_token",
-                "email_verification_sent_at",
-            ]
+        User.objects.filter(pk=self.pk).update(
+            email_verified=True,
+            email_verification_token=None,
+            email_verification_sent_at=None,
         )
 
         return True
 
     def save(self, *args: Any, **kwargs: Any) -> None:
-        """Override save to ensure that an email is always stored in lowercase."""
-        if self.email:
-            self.email = self.email.lower()
+        """
+        Override save to strip surrounding whitespace from the username.
 
+        A new user gets its Profile and UserPreferences in the same
+        transaction.
+        """
         if self.username:
             self.username = self.username.strip()
 
-        super().save(*args, **kwargs)
+        if self._state.adding:
+            with transaction.atomic(using=kwargs.get("using")):
+                super().save(*args, **kwargs)
+                Profile.objects.using(self._state.db).create(user=self)
+                UserPreferences.objects.using(self._state.db).create(user=self)
+        else:
+            super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return f"User: {self.username}"
@@ -180,11 +219,19 @@ class User(AbstractUser):
         db_table = "user"
         verbose_name = "User"
         verbose_name_plural = "Users"
+        # email and username are already indexed by their unique constraints.
         indexes = [
-            models.Index(fields=["email"]),
-            models.Index(fields=["username"]),
             models.Index(fields=["last_active"]),
         ]
+        constraints = [
+            # Emails are stored as entered; uniqueness and login lookups go
+            # through this LOWER(email) index instead.
+            models.UniqueConstraint(
+                Lower("email"),
+                name="user_email_lower_unique",
+                violation_error_message="A user with that email already exists.",
+            ),
+        ]
 
 
 class Profile(models.Model):
@@ -278,12 +325,21 @@ class Profile(models.Model):
         """
         Get the URL for the user's avatar or a default avatar.
 
+        The storage URL is memoized per instance for the current avatar name,
+        so templates that render it repeatedly hit the storage backend once.
+
         Returns:
             URL to the avatar image
         """
-        from django.templatetags.static import static
+        name = self.avatar.name
+        if not name:
+            return static("img/default_avatar.jpg")
 
-        return self.avatar.url if self.avatar else static("img/default_avatar.jpg")
+        cached = getattr(self, "_avatar_url", None)
+        if cached is None or cached[0] != name:
+            cached = self._avatar_url = (name, self.avatar.url)
+
+        return cached[1]
 
     def get_social_links(self) -> dict:
         """
@@ -292,16 +348,11 @@ class Profile(models.Model):
         Returns:
             Dictionary of social media platform names and URLs
         """
-        links = {}
-
-        if self.x:
-            links["x"] = f"https://x.com/{self.x}"
-
-        if self.github:
-            links["github"] = f"https://github.com/{self.github}"
-
-        if self.linkedin:
-            links["linkedin"] = f"https://linkedin.com/in/{self.linkedin}"
+        links = {
+            field: template.format(value)
+            for field, template in SOCIAL_LINK_TEMPLATES
+            if (value := getattr(self, field))
+        }
 
         if self.website:
             links["website"] = self.website
@@ -0,0 +1,46 @@
+"""Read-only query helpers for user lookups."""
+
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+from .models import User
+
+# Columns read from request.user on a typical request, including the password
+# hash used to verify the session.
+SESSION_USER_FIELDS = (
+    "pk",
+    "password",
+    "email",
+    "username",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+    "last_login",
+    "last_active",
+)
+
+
+def get_login_user(identifier: str) -> User | None:
+    """
+    Return the user matching a login identifier.
+
+    The identifier is matched case-insensitively against both username and
+    email in a single query. Only SESSION_USER_FIELDS are loaded, which
+    covers the password check and login().
+
+    Args:
+        identifier: Username or email address
+
+    Returns:
+        The matching user, or None if no user matches
+    """
+    # Usernames are validated to be lowercase, so both branches compare the
+    # lowercased identifier and are served by the unique username index and
+    # the LOWER(email) unique index respectively.
+    identifier_lower = identifier.lower()
+    return (
+        User.objects.only(*SESSION_USER_FIELDS)
+        .alias(email_lower=Lower("email"))
+        .filter(Q(username=identifier_lower) | Q(email_lower=identifier_lower))
+        .first()
+    )
@@ -1,7 +1,40 @@
+from types import MappingProxyType
+
 import pytest
 
 from users.forms import UserLoginForm, UserRegisterForm
-from users.models import User
+
+# Length-boundary inputs
+LONGEST_USERNAME = "a" * 30
+TOO_LONG_USERNAME = "a" * 31
+TOO_LONG_EMAIL = "a" * 250 + "@example.com"
+TOO_LONG_LOGIN = "a" * 251
+TOO_LONG_PASSWORD = "a" * 129
+
+# Valid, read-only form data
+REGISTER_BASE = MappingProxyType(
+    {
+        "username": "testuser",
+        "email": "test@example.com",
+        "password1": "securepass.123",
+        "password2": "securepass.123",
+    }
+)
+LOGIN_BASE = MappingProxyType({"username": "testuser", "password": "testpass123"})
+LOGIN_REQUIRED_FIELDS = frozenset(LOGIN_BASE)
+
+# Malicious inputs
+XSS_PAYLOADS = (
+    '<script>alert("xss")</script>',
+    '<img src="x" onerror="alert(1)">',
+    '"><script>alert(document.cookie)</script>',
+)
+SQL_PAYLOADS = (
+    "'; DROP TABLE users; --",
+    "' OR '1'='1",
+    "admin'--",
+    "' UNION SELECT * FROM users --",
+)
 
 
 class TestUserRegisterForm:
@@ -38,18 +71,13 @@ class TestUserRegisterForm:
         [
             "user123",
             "test_user",
-            "a" * 30,
+            LONGEST_USERNAME,
         ],
+        ids=["alnum", "underscore", "max_length"],
     )
     def test_valid_username(self, username):
         """Test that valid username passes validation."""
-        base_data = {
-            "email": "test@example.com",
-            "password1": "securepass.123",
-            "password2": "securepass.123",
-        }
-
-        form = UserRegisterForm(data={**base_data, "username": username})
+        form = UserRegisterForm(data={**REGISTER_BASE, "username": username})
         assert form.is_valid()
         assert "username" not in form.errors
 
@@ -64,19 +92,25 @@ class TestUserRegisterForm:
             "_user123",  # Begin with underscore
             "user123_",  # End with underscore
             "user____123",  # Consecutive underscores
-            "a" * 31,  # Too long (> 30 chars)
+            TOO_LONG_USERNAME,  # Too long (> 30 chars)
             "us",  # Too short (< 3 chars)
         ],
+        ids=[
+            "hyphen",
+            "at",
+            "space",
+            "dot",
+            "hash",
+            "lead_us",
+            "trail_us",
+            "dbl_us",
+            "too_long",
+            "too_short",
+        ],
     )
     def test_invalid_username(self, username):
         """Test that invalid username doesn't pass validation."""
-        base_data = {
-            "email": "test@example.com",
-            "password1": "securepass.123",
-            "password2": "securepass.123",
-        }
-
-        form = UserRegisterForm(data={**base_data, "username": username})
+        form = UserRegisterForm(data={**REGISTER_BASE, "username": username})
         assert not form.is_valid()
         if 3 <= len(username) <= 100:
             assert "username" in form.errors
@@ -89,16 +123,11 @@ class TestUserRegisterForm:
             "user+tag@example.co.uk",
             "very.long.email.address@very.long.domain.example.com",
         ],
+        ids=["plain", "dot", "plus_tag", "long"],
     )
     def test_valid_email(self, email):
         """Test that valid email passes validation."""
-        base_data = {
-            "username": "testuser",
-            "password1": "securepass.123",
-            "password2": "securepass.123",
-        }
-
-        form = UserRegisterForm(data={**base_data, "email": email})
+        form = UserRegisterForm(data={**REGISTER_BASE, "email": email})
         assert form.is_valid()
         assert "email" not in form.errors
 
@@ -110,18 +139,13 @@ class TestUserRegisterForm:
             "@example.com",
             "user space@example.com",
             "user@example",
-            "a" * 250 + "@example.com",
+            TOO_LONG_EMAIL,
         ],
+        ids=["no_at", "no_domain", "no_local", "space", "no_tld", "too_long"],
     )
     def test_invalid_email(self, email):
         """Test that invalid email doesn't pass validation."""
-        base_data = {
-            "username": "testuser",
-            "password1": "securepass.123",
-            "password2": "securepass.123",
-        }
-
-        form = UserRegisterForm(data={**base_data, "email": email})
+        form = UserRegisterForm(data={**REGISTER_BASE, "email": email})
         assert not form.is_valid()
         assert "email" in form.errors
 
@@ -136,12 +160,7 @@ class TestUserRegisterForm:
     )
     def test_valid_password(self, password):
         """Test that valid password passes validation."""
-        base_data = {
-            "username": "testuser",
-            "email": "test@example.com",
-        }
-
-        form_data = {**base_data, "password1": password, "password2": password}
+        form_data = {**REGISTER_BASE, "password1": password, "password2": password}
         form = UserRegisterForm(data=form_data)
         assert form.is_valid()
         assert "password1" not in form.errors
@@ -157,54 +176,59 @@ class TestUserRegisterForm:
     )
     def test_invalid_password(self, password):
         """Test that invalid password doesn't pass validation."""
-        base_data = {
-            "username": "testuser",
-            "email": "test@example.com",
-        }
-
-        form_data = {**base_data, "password1": password, "password2": password}
+        form_data = {**REGISTER_BASE, "password1": password, "password2": password}
         form = UserRegisterForm(data=form_data)
         assert not form.is_valid()
         assert "password1" in form.errors
-        assert "password2" in form.errors
-
-    def test_password_mismatch(self):
-        """Test that mismatched passwords are rejected."""
-        form_data = {
-            "username": "testuser",
-            "email": "test@example.com",
-            "password1": "securepassword.123",
-            "password2": "differentpassword.123",
-        }
 
+    @pytest.mark.parametrize(
+        ("form_data", "expected_errors", "expected_cleaned"),
+        [
+            pytest.param(
+                {},
+                {
+                    "username": "required",
+                    "email": "required",
+                    "password1": "required",
+                    "password2": "required",
+                },
+                None,
+                id="empty_fields",
+            ),
+            pytest.param(
+                {
+                    "username": "testuser",
+                    "email": "test@example.com",
+                    "password1": "securepassword.123",
+                    "password2": "differentpassword.123",
+                },
+                {"__all__": "password_mismatch"},
+                None,
+                id="password_mismatch",
+            ),
+            pytest.param(
+                {
+                    "username": "   testuser   ",
+                    "email": "   test@example.com   ",
+                    "password1": "securepass.123",
+                    "password2": "securepass.123",
+                },
+                {},
+                {"username": "testuser", "email": "test@example.com"},
+                id="whitespace_handling",
+            ),
+        ],
+    )
+    def test_form_validation(self, form_data, expected_errors, expected_cleaned):
+        """Test required fields, password matching and whitespace stripping."""
         form = UserRegisterForm(data=form_data)
-        assert not form.is_valid()
-        assert "__all__" in form.errors
-        assert "match" in str(form.errors["__all__"][0]).lower()
+        assert form.is_valid() is not bool(expected_errors)
 
-    def test_empty_fields(self):
-        """Test that required fields cannot be empty."""
-        form = UserRegisterForm(data={})
-        assert not form.is_valid()
+        for field, code in expected_errors.items():
+            assert form.has_error(field, code)
 
-        required_fields = ["username", "email", "password1", "password2"]
-        for field in required_fields:
-            assert field in form.errors
-
-    def test_whitespace_handling(self):
-        """Test that whitespace in fields is handled correctly."""
-        form_data = {
-            "username": "   testuser   ",
-            "email": "   test@example.com   ",
-            "password1": "securepass.123",
-            "password2": "securepass.123",
-        }
-
-        form = UserRegisterForm(data=form_data)
-        assert form.is_valid()
-
-        assert form.cleaned_data["username"] == "testuser"
-        assert form.cleaned_data["email"] == "test@example.com"
+        for field, value in (expected_cleaned or {}).items():
+            assert form.cleaned_data[field] == value
 
 
 class TestUserLoginForm:
@@ -219,13 +243,6 @@ class TestUserLoginForm:
     - Edge cases
     """
 
-    @pytest.fixture
-    def user(self):
-        """Fixture to create a user instance."""
-        User.objects.create_user(
-            username="testuser", email="test@example.com", password="testpassword.123"
-        )
-
     def test_valid_login_form(self):
         """Test that valid form data passes validation."""
         form_data = {"username": "testuser", "password": "testpassword.123"}
@@ -252,8 +269,7 @@ class TestUserLoginForm:
         form = UserLoginForm(data={})
         assert not form.is_valid()
 
-        assert "username" in form.errors
-        assert "password", form.errors
+        assert form.errors.keys() >= LOGIN_REQUIRED_FIELDS
 
     def test_empty_username(self):
         """Test handling of empty username field."""
@@ -285,29 +301,25 @@ class TestUserLoginForm:
 
     def test_long_username_field(self):
         """Test maximum length validation for username field."""
-        long_username = "a" * 251  # Exceeds max_length=250
-
-        form_data = {"username": long_username, "password": "testpassword123"}
+        form_data = {"username": TOO_LONG_LOGIN, "password": "testpassword123"}
 
         form = UserLoginForm(data=form_data)
         assert not form.is_valid()
         assert "username" in form.errors
 
-    def test_password_length_validation(self):
-        """Test password length validation."""
-        form_data = {
-            "username": "testuser",
-            "password": "1234567",  # 7 chars, minimum is 8
-        }
-
-        form = UserLoginForm(data=form_data)
-        assert not form.is_valid()
-        assert "password" in form.errors
-
-        form_data["password"] = "a" * 129  # Exceeds max_length=128
-        form = UserLoginForm(data=form_data)
-        assert not form.is_valid()
-        assert "password" in form.errors
+    @pytest.mark.parametrize(
+        ("password", "is_valid"),
+        [
+            ("1234567", True),  # Short passwords are left to authentication
+            (TOO_LONG_PASSWORD, False),  # Exceeds max_length=128
+        ],
+        ids=["short", "too_long"],
+    )
+    def test_password_length_validation(self, password, is_valid):
+        """Test that only the maximum password length is validated on login."""
+        form = UserLoginForm(data={**LOGIN_BASE, "password": password})
+        assert form.is_valid() is is_valid
+        assert ("password" in form.errors) is not is_valid
 
 
 class TestFormSecurity:
@@ -331,51 +343,31 @@ class TestFormSecurity:
         }
 
         form = UserRegisterForm(data=form_data)
-        try:
-            form.is_valid()
-        except Exception as e:
-            pytest.fail(f"Form should handle Unicode input without crashing: {e}")
-
-    @pytest.mark.parametrize(
-        "malicious_input",
-        [
-            '<script>alert("xss")</script>',
-            '<img src="x" onerror="alert(1)">',
-            '"><script>alert(document.cookie)</script>',
-        ],
-    )
-    def test_html_injection_prevention(self, malicious_input):
-        """Test that HTML/script tags in input are handled safely."""
-        form_data = {
-            "username": malicious_input,
-            "email": "test@example.com",
-            "password1": "securepass123",
-            "password2": "securepass123",
-        }
-
-        form = UserRegisterForm(data=form_data)
-        try:
-            form.is_valid()
-            if form.is_valid():
-                assert "<script>" not in form.cleaned_data.get("username", "")
-        except Exception as e:
-            pytest.fail(f"Form should handle malicious input safely: {e}")
+        # An exception here fails the test; the form must not crash.
+        form.is_valid()
 
     @pytest.mark.parametrize(
-        "sql_input",
+        ("form_class", "base_data", "payload", "must_reject"),
         [
-            "'; DROP TABLE users; --",
-            "' OR '1'='1",
-            "admin'--",
-            "' UNION SELECT * FROM users --",
+            *(
+                pytest.param(
+                    UserRegisterForm, REGISTER_BASE, payload, True, id=f"xss{i}"
+                )
+                for i, payload in enumerate(XSS_PAYLOADS)
+            ),
+            *(
+                pytest.param(UserLoginForm, LOGIN_BASE, payload, False, id=f"sql{i}")
+                for i, payload in enumerate(SQL_PAYLOADS)
+            ),
         ],
     )
-    def test_sql_injection_prevention(self, sql_input):
-        """Test that SQL injection attempts are handled safely."""
-        form_data = {"username": sql_input, "password": "testpass123"}
-
-        form = UserLoginForm(data=form_data)
-        try:
-            form.is_valid()
-        except Exception as e:
-            pytest.fail(f"Form should handle SQL injection attempts safely: {e}")
+    def test_malicious_input_handling(
+        self, form_class, base_data, payload, must_reject
+    ):
+        """Test that HTML/script and SQL injection attempts are handled safely."""
+        form = form_class(data={**base_data, "username": payload})
+        # An exception here fails the test; the form must not crash.
+        is_valid = form.is_valid()
+        if must_reject:
+            # The username validator rejects markup characters outright.
+            assert not is_valid
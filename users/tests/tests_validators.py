@@ -0,0 +1,77 @@
+import pytest
+from django.core.exceptions import ValidationError
+
+from users.validators import (
+    UserPasswordValidator,
+    validate_user_password,
+    validate_user_username,
+)
+
+
+class TestUserPasswordValidator:
+    """Test cases for the UserPasswordValidator."""
+
+    @pytest.mark.parametrize(
+        "valid_password",
+        [
+            "Password!123",
+            "MySecure@Pass1",
+            "Complex#Pass123",
+            "Strong$Password1",
+            "Test&Password123",
+        ],
+    )
+    def test_valid_passwords(self, valid_password):
+        """Test that valid passwords pass validation."""
+        validate_user_password(valid_password)
+
+    @pytest.mark.parametrize(
+        "invalid_password,expected_error",
+        [
+            ("short", "too_short"),
+            ("password123", "invalid_characters"),
+            ("PASSWORD123", "invalid_characters"),
+            ("Password!", "invalid_characters"),
+            ("Password123", "invalid_characters"),
+            ("a" * 121, "too_long"),
+        ],
+    )
+    def test_invalid_passwords(self, invalid_password, expected_error):
+        """Test that invalid passwords fail validation."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_user_password(invalid_password)
+        assert expected_error in str(exc_info.value.code)
+
+    def test_non_string_password(self):
+        """Test that non-string input raises ValidationError."""
+        with pytest.raises(ValidationError):
+            validate_user_password(12345)
+
+    def test_custom_length_bounds(self):
+        """Test that the pattern leaves length limits to the validator's bounds."""
+        validator = UserPasswordValidator(min_length=6)
+        validator("Pass!1")  # Should not raise
+
+        with pytest.raises(ValidationError) as exc_info:
+            validator("Passwd")
+        assert exc_info.value.code == "invalid_characters"
+        assert "8-120" not in exc_info.value.message
+
+
+class TestUserUsernameValidator:
+    """Test cases for the UserUsernameValidator."""
+
+    @pytest.mark.parametrize(
+        "invalid_username,expected_error",
+        [
+            ("", "too_short"),
+            ("   ", "too_short"),
+            (None, "invalid_type"),
+            (12345, "invalid_type"),
+        ],
+    )
+    def test_invalid_usernames(self, invalid_username, expected_error):
+        """Test that empty and non-string usernames fail before the pattern."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_user_username(invalid_username)
+        assert exc_info.value.code == expected_error
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .models import Profile
 
+AVATAR_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "gif", "webp"})
+
 
 def user_avatar_path(instance: "Profile", filename: str) -> str:
     """
@@ -18,9 +20,9 @@ def user_avatar_path(instance: "Profile", filename: str) -> str:
     Returns:
         Path where the avatar should be stored
     """
-    ext = filename.split(".")[-1].lower()
-    if ext not in ["jpg", "jpeg", "png", "gif", "webp"]:
+    ext = filename.rpartition(".")[2].lower()
+    if ext not in AVATAR_EXTENSIONS:
         ext = "jpg"
 
-    random_str = secrets.token_urlsafe(8)
+    random_str = secrets.token_hex(8)
     return f"avatars/user_{instance.user.id}_{random_str}.{ext}"
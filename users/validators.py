@@ -10,7 +10,13 @@ class UserPasswordValidator:
 
     MIN_LENGTH = 8
     MAX_LENGTH = 120
-    PATTERN = r"^(?=.*[a-zA-Z])(?=.*\d)(?=.*[!@#$%^&*(),.?\":{}|<>])[A-Za-z\d!@#$%^&*(),.?\":{}|<>]{8,120}$"
+    # Each lookahead skips over its negated class, so it stops at the first
+    # letter/digit/special instead of running to the end and backtracking.
+    PATTERN = re.compile(
+        r"^(?=[^a-zA-Z]*[a-zA-Z])(?=\D*\d)"
+        r"(?=[^!@#$%^&*(),.?\":{}|<>]*[!@#$%^&*(),.?\":{}|<>])"
+        r"[A-Za-z\d!@#$%^&*(),.?\":{}|<>]+$"
+    )
 
     def __init__(
         self, min_length: int | None = None, max_length: int | None = None
@@ -34,13 +40,14 @@ class UserPasswordValidator:
 
     def _validate_length(self, value: str) -> None:
         """Validate name length."""
-        if len(value) < self.min_length:
+        length = len(value)
+        if length < self.min_length:
             raise ValidationError(
                 f"Password must be at least {self.min_length} characters long.",
                 code="too_short",
             )
 
-        if len(value) > self.max_length:
+        if length > self.max_length:
             raise ValidationError(
                 f"Password cannot exceed {self.max_length} characters.",
                 code="too_long",
@@ -48,11 +55,11 @@ class UserPasswordValidator:
 
     def _validate_pattern(self, value: str) -> None:
         """Validate character pattern."""
-        if not re.fullmatch(self.PATTERN, value):
+        if not self.PATTERN.fullmatch(value):
             raise ValidationError(
                 (
-                    "Password must be 8-120 characters long and include at least one "
-                    "letter, one number, and one special character "
+                    "Password must include at least one letter, one number, and one "
+                    "special character "
                     '(!,@,#,$,%,^,&,*,(,),,,.,?,",:,{,},|,<,>).'
                 ),
                 code="invalid_characters",
@@ -65,7 +72,9 @@ class UserUsernameValidator:
 
     MIN_LENGTH = 3
     MAX_LENGTH = 30
-    PATTERN = r"^[a-z0-9_]+$"
+    PATTERN = re.compile(r"^[a-z0-9_]+$")
+    # Every rule below in one pattern: underscores only between other characters
+    VALID_PATTERN = re.compile(r"[a-z0-9]+(?:_[a-z0-9]+)*")
 
     def __init__(
         self,
@@ -77,22 +86,33 @@ class UserUsernameValidator:
 
     def __call__(self, value: str) -> None:
         """Call main validator method."""
+        if not isinstance(value, str):
+            raise ValidationError(
+                "Username must be a string.",
+                code="invalid_type",
+            )
+
         cleaned_value = value.strip()
 
         self._validate_length(cleaned_value)
+        if self.VALID_PATTERN.fullmatch(cleaned_value):
+            return
+
+        # Invalid: run the individual checks to report the broken rule
         self._validate_pattern(cleaned_value)
         self._validate_bounds(cleaned_value)
         self._validate_no_consecutive_underscores(cleaned_value)
 
     def _validate_length(self, value: str) -> None:
         """Validate name length."""
-        if len(value) < self.min_length:
+        length = len(value)
+        if length < self.min_length:
             raise ValidationError(
                 f"Username must be at least {self.min_length} characters long.",
                 code="too_short",
             )
 
-        if len(value) > self.max_length:
+        if length > self.max_length:
             raise ValidationError(
                 f"Username cannot exceed {self.max_length} characters.",
                 code="too_long",
@@ -100,7 +120,7 @@ class UserUsernameValidator:
 
     def _validate_pattern(self, value: str) -> None:
         """Validate character pattern."""
-        if not re.fullmatch(self.PATTERN, value):
+        if not self.PATTERN.fullmatch(value):
             raise ValidationError(
                 "Username can only contain lower case letters, numbers and underscores.",
                 code="invalid_characters",
@@ -122,7 +142,7 @@ class UserUsernameValidator:
     @staticmethod
     def _validate_no_consecutive_underscores(value: str) -> None:
         """Validate that the string doesn't contain two or more consecutive underscores."""
-        if re.search(r"_{2,}", value):
+        if "__" in value:
             raise ValidationError(
                 "Username cannot contain consecutive underscores.",
                 code="consecutive_underscores",
@@ -130,3 +150,4 @@ class UserUsernameValidator:
 
 
 validate_user_password = UserPasswordValidator()
+validate_user_username = UserUsernameValidator()
@@ -14,7 +14,7 @@ from posts.models import Post, PostVote
 
 from .forms import UserLoginForm, UserRegisterForm
 from .models import User
-from .services import UserAuthService
+from .services import auth_service
 
 
 class UserRegisterView(View):
@@ -27,12 +27,12 @@ class UserRegisterView(View):
     Attributes:
         form_class: The form class used for user registration.
         template_name: Template path for rendering the registration page.
-        service: Service class handling registration business logic.
+        service: Shared service instance handling registration business logic.
     """
 
     form_class = UserRegisterForm
     template_name = "users/sign-up.html"
-    service = UserAuthService()
+    service = auth_service
 
     def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         """
@@ -76,8 +76,11 @@ class UserRegisterView(View):
             if result.success:
                 return redirect(result.redirect_url)
 
-            for field, error in result.errors.items():
-                form.add_error(field, error)
+            if result.errors:
+                for field, error in result.errors.items():
+                    form.add_error(field, error)
+            else:
+                form.add_error(None, result.error_message)
 
         return render(request, self.template_name, {"form": form})
 
@@ -92,12 +95,12 @@ class UserLoginView(View):
     Attributes:
         form_class: The form class used for user login.
         template_name: Template path for rendering the login page.
-        service: Service class handling authentication business logic.
+        service: Shared service instance handling authentication business logic.
     """
 
     form_class = UserLoginForm
     template_name = "users/sign-in.html"
-    service = UserAuthService()
+    service = auth_service
 
     def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         """
@@ -170,15 +173,20 @@ class UserPageView(PaginatedViewMixin, DetailView):
     slug_field = "username"
     slug_url_kwarg = "username"
 
+    def get_queryset(self) -> QuerySet["User"]:
+        """Return users with just the columns the page header renders."""
+        return User.objects.with_profile().only("username", "profile__avatar")
+
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         """Add user subscriptions to context if authenticated."""
         context = super().get_context_data(**kwargs)
         if self.request.user.is_authenticated:
+            # Only used for "post.community in subscriptions", which compares pks
             context["subscriptions"] = Community.objects.filter(
                 subscriptions__user=self.request.user
-            )
+            ).only("pk")
         else:
-            context["subscriptions"] = []
+            context["subscriptions"] = ()
 
         return context
 
@@ -186,7 +194,7 @@ class UserPageView(PaginatedViewMixin, DetailView):
         """Return posts created by the profile user."""
         queryset = (
             Post.objects.filter(user=self.object)
-            .select_related("community", "user")
+            .select_related("community", "user__profile")
             .order_by("-created_at")
         )
 